@@ -56,8 +56,9 @@ def get_suppress_data(suppress_file):
 
     suppress_data = []
     for line in suppress_file:
+        stripped_line = line.strip()
 
-        src_suppress_format_match = re.match(src_suppress_format, line.strip())
+        src_suppress_format_match = src_suppress_format.match(stripped_line)
         if src_suppress_format_match:
             LOG.debug('Match for source code suppress entry format:')
             src_suppress_format_match = src_suppress_format_match.groupdict()
@@ -68,7 +69,7 @@ def get_suppress_data(suppress_file):
                                   src_suppress_format_match['status']))
             continue
 
-        new_format_match = re.match(new_format, line.strip())
+        new_format_match = new_format.match(stripped_line)
         if new_format_match:
             LOG.debug('Match for new suppress entry format:')
             new_format_match = new_format_match.groupdict()
@@ -79,7 +80,7 @@ def get_suppress_data(suppress_file):
                                   'false_positive'))
             continue
 
-        old_format_match = re.match(old_format, line.strip())
+        old_format_match = old_format.match(stripped_line)
         if old_format_match:
             LOG.debug('Match for old suppress entry format:')
             old_format_match = old_format_match.groupdict()
@@ -90,7 +91,7 @@ def get_suppress_data(suppress_file):
                                   'false_positive'))
             continue
 
-        if line.strip() != '':
+        if stripped_line != '':
             LOG.warning('Malformed suppress line: %s', line)
 
     return suppress_data
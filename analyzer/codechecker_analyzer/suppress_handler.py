@@ -26,10 +26,13 @@ class GenericSuppressHandler:
         """
         self.__suppress_info = []
         self.__allow_write = allow_write
-        self.src_comment_status_filter = src_comment_status_filter or []
+        self.src_comment_status_filter = \
+            frozenset(src_comment_status_filter or [])
+
+        # File on the filesystem where the suppress data will be written.
+        self.suppress_file = suppress_file
 
         if suppress_file:
-            self.suppress_file = suppress_file
             self.__have_memory_backend = True
             self.__revalidate_suppress_data()
         else:
@@ -39,17 +42,6 @@ class GenericSuppressHandler:
                 raise ValueError("Can't create allow_write=True suppress "
                                  "handler without a backend file.")
 
-    @property
-    def suppress_file(self):
-        """" File on the filesystem where the suppress
-        data will be written. """
-        return self.__suppressfile
-
-    @suppress_file.setter
-    def suppress_file(self, value):
-        """ Set the suppress file. """
-        self.__suppressfile = value
-
     def __revalidate_suppress_data(self):
         """Reload the information in the suppress file to the memory."""
 
@@ -319,7 +319,6 @@ class Report:
 
         self.__source_code_comments: Optional[SourceCodeComments] = None
         self.__source_code_comment_warnings: List[str] = []
-        self.__sc_handler = SourceCodeCommentHandler()
 
         self.__source_line: Optional[str] = source_line
         self.__files: Optional[Set[File]] = None
@@ -452,7 +451,7 @@ class Report:
                   encoding='utf-8', errors='ignore') as f:
             try:
                 self.__source_code_comments = \
-                    self.__sc_handler.filter_source_line_comments(
+                    SourceCodeCommentHandler().filter_source_line_comments(
                         f, self.line, self.checker_name)
             except SpellException as ex:
                 self.__source_code_comment_warnings.append(
@@ -13,9 +13,10 @@ import json
 import logging
 import re
 
-from typing import Dict, Iterable, List, Optional, Set, TextIO, Tuple
-
-from . import util
+from collections import deque
+from itertools import islice
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, \
+    Pattern, Sequence, Set, TextIO, Tuple
 
 
 LOG = logging.getLogger('report-converter')
@@ -24,6 +25,17 @@ LOG = logging.getLogger('report-converter')
 REVIEW_STATUS_VALUES = ["confirmed", "false_positive", "intentional",
                         "suppress", "unreviewed"]
 
+# Review status of the source code comment markers.
+_REVIEW_STATUS_OF_MARKER = {
+    'codechecker_suppress': 'false_positive',
+    'codechecker_false_positive': 'false_positive',
+    'codechecker_intentional': 'intentional',
+    'codechecker_confirmed': 'confirmed'}
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+_COMMENT_PREFIX_RE = re.compile(r'\s*//')
+
 
 def contains_codechecker_comment(fp):
     """Returns true if the file content contains any
@@ -97,13 +109,89 @@ class SourceCodeCommentHandler:
         'codechecker_intentional',
         'codechecker_confirmed']
 
+    # Compiled patterns built from the comment markers of the class.
+    _pattern: Pattern[str]
+    _marker_pattern: Pattern[str]
+
+    def __init__(self):
+        self.__fp: Optional[TextIO] = None
+        self.__lines: List[str] = []
+        self.__all_lines_read = False
+        self.__comment_cache: Dict[int, SourceCodeComments] = {}
+
+    @classmethod
+    def _get_pattern(cls) -> Pattern[str]:
+        """
+        Return the compiled pattern of a source code comment. The pattern is
+        compiled only once for each class based on its comment markers.
+        """
+        if '_pattern' not in cls.__dict__:
+            comment_markers = cls._get_marker_pattern().pattern
+            cls._pattern = re.compile(
+                r'^\s*(?P<status>' + comment_markers + r')'
+                r'\s*\[\s*(?P<checkers>[^\]]*)\s*\]\s*(?P<comment>.*)$')
+
+        return cls._pattern
+
+    @classmethod
+    def _get_marker_pattern(cls) -> Pattern[str]:
+        """
+        Return the compiled pattern which matches any of the comment markers
+        of the class. The pattern is compiled only once for each class.
+        """
+        if '_marker_pattern' not in cls.__dict__:
+            cls._marker_pattern = re.compile('|'.join(
+                map(re.escape, cls.source_code_comment_markers)))
+
+        return cls._marker_pattern
+
+    def __select_file(self, fp: TextIO):
+        """
+        Drop the lines and comments cached for the previous file object if
+        another file object is given.
+        """
+        if fp is not self.__fp:
+            self.__fp = fp
+            self.__lines = []
+            self.__all_lines_read = False
+            self.__comment_cache = {}
+
+    def __read_lines(
+        self,
+        fp: TextIO,
+        line_count: Optional[int] = None
+    ) -> List[str]:
+        """
+        Return the first line_count lines of the given file object or all of
+        its lines if line_count is None. Less lines are returned if the file
+        is shorter. The lines are read again only if more lines are needed
+        than the ones already read from the same file object.
+        The position in the file object is restored where it was before the
+        reading.
+        """
+        self.__select_file(fp)
+
+        if not self.__all_lines_read and \
+                (line_count is None or line_count > len(self.__lines)):
+            pos_before_read = fp.tell()
+            fp.seek(0)
+            if line_count is None:
+                self.__lines = fp.readlines()
+                self.__all_lines_read = True
+            else:
+                self.__lines = list(islice(fp, line_count))
+                self.__all_lines_read = len(self.__lines) < line_count
+            fp.seek(pos_before_read)
+
+        return self.__lines
+
     @staticmethod
     def __check_if_comment(source_line: str) -> bool:
         """
         Check if the line is a comment.
         Accepted comment format is only if line starts with '//'.
         """
-        return source_line.strip().startswith('//')
+        return _COMMENT_PREFIX_RE.match(source_line) is not None
 
     @staticmethod
     def __check_if_cstyle_comment(source_line) -> Tuple[bool, bool]:
@@ -111,9 +199,8 @@ class SourceCodeCommentHandler:
         Check if the line contains the start '/*' or
         the the end '*/' of a C style comment.
         """
-        src_line = source_line.strip()
-        cstyle_start = '/*' in src_line
-        cstyle_end = '*/' in src_line
+        cstyle_start = '/*' in source_line
+        cstyle_end = '*/' in source_line
         return cstyle_start, cstyle_end
 
     def __process_source_line_comment(
@@ -144,21 +231,15 @@ class SourceCodeCommentHandler:
 
         """
         # Remove extra spaces if any.
-        formatted = ' '.join(source_line_comment.split())
+        formatted = _WHITESPACE_RE.sub(' ', source_line_comment).strip()
 
         # Check for codechecker source code comment.
-        comment_markers = '|'.join(self.source_code_comment_markers)
-        pattern = r'^\s*(?P<status>' + comment_markers + r')' \
-                  + r'\s*\[\s*(?P<checkers>[^\]]*)\s*\]\s*(?P<comment>.*)$'
-
-        ptn = re.compile(pattern)
-        res = re.match(ptn, formatted)
+        res = self._get_pattern().match(formatted)
 
         if not res:
             return None
 
         checkers_names = set()
-        review_status = 'false_positive'
         message = "WARNING! source code comment is missing"
 
         # Get checker names from suppress comment.
@@ -166,9 +247,8 @@ class SourceCodeCommentHandler:
         if checkers == "all":
             checkers_names.add('all')
         else:
-            suppress_checker_list = re.findall(r"[^,\s]+",
-                                               checkers.strip())
-            checkers_names.update(suppress_checker_list)
+            # Checker names are separated by commas and/or whitespaces.
+            checkers_names.update(checkers.replace(',', ' ').split())
 
         # Get comment message from suppress comment.
         comment = res.group('comment')
@@ -176,26 +256,63 @@ class SourceCodeCommentHandler:
             message = comment
 
         # Get status from suppress comment.
-        status = res.group('status')
-        if status == 'codechecker_intentional':
-            review_status = 'intentional'
-        elif status == 'codechecker_confirmed':
-            review_status = 'confirmed'
+        review_status = _REVIEW_STATUS_OF_MARKER.get(
+            res.group('status'), 'false_positive')
 
         return SourceCodeComment(checkers_names, message, review_status)
 
+    def __parse_review_comment(
+        self,
+        comment_lines: Sequence[str],
+        line_num: int
+    ) -> SourceCodeComment:
+        """
+        Parse a review comment from the given comment lines. The first line
+        is the line containing the comment marker which can be found at
+        line_num.
+
+        raise: SpellException in case there is a spell error in the
+               codechecker review comment keyword
+        """
+        orig_review_comment = ' '.join(comment_lines)
+
+        if SourceCodeCommentHandler.__check_if_comment(comment_lines[0]):
+            review_comment = orig_review_comment.replace('//', '')
+        else:
+            r_comment = []
+            for comment in comment_lines:
+                comment = comment.strip()
+                comment = comment.replace('/*', '').replace('*/', '')
+                if comment.startswith('*'):
+                    r_comment.append(comment[1:])
+                else:
+                    r_comment.append(comment)
+
+            review_comment = ' '.join(r_comment).strip()
+
+        source_line_comment = self.__process_source_line_comment(
+            review_comment)
+
+        if not source_line_comment:
+            raise SpellException(
+                    f"misspelled review status comment "
+                    f"@{line_num}: "
+                    f"{orig_review_comment.strip()}")
+
+        source_line_comment.line = orig_review_comment
+        return source_line_comment
+
     def has_source_line_comments(self, fp: TextIO, line: int) -> bool:
         """
         Return True if there is any source code comment or False if not,
         for a given line.
         """
         try:
-            comments = self.get_source_line_comments(fp, line)
+            return self.__has_any_source_line_comment(fp, line)
         except SpellException as ex:
             # Misspell in the review status comment.
             LOG.warning(ex)
             return False
-        return bool(comments)
 
     def scan_source_line_comments(
         self,
@@ -213,6 +330,10 @@ class SourceCodeCommentHandler:
         if not contains_codechecker_comment(fp):
             return comments, misspelled_comments
 
+        # Multiple lines of the same file are queried, so read the whole file
+        # only once.
+        self.__read_lines(fp)
+
         line_numbers = sorted(line_numbers)
         for num in line_numbers:
             try:
@@ -231,21 +352,79 @@ class SourceCodeCommentHandler:
         raise: SpellException in case there is a spell error in the
                codechecker review comment keyword
         """
-        previous_line_num = bug_line - 1
-
         # No more line.
-        if previous_line_num < 1:
+        if bug_line <= 1:
             return []
 
-        source_line_comments = []
-        curr_suppress_comment = []
+        cached = self.__get_cached_comments(fp, bug_line)
+        if cached is not None:
+            return list(cached)
+
+        source_line_comments = \
+            list(self.__iter_source_line_comments(fp, bug_line))
+        self.__comment_cache[bug_line] = source_line_comments
+
+        return list(source_line_comments)
+
+    def __has_any_source_line_comment(self, fp: TextIO, bug_line: int) -> bool:
+        """
+        Return True if there is any source code comment for the bug line.
+        Unlike get_source_line_comments it stops at the first comment found,
+        so a misspelled comment above a valid one is not reported.
+
+        raise: SpellException in case there is a spell error in the
+               codechecker review comment keyword
+        """
+        if bug_line <= 1:
+            return False
+
+        cached = self.__get_cached_comments(fp, bug_line)
+        if cached is not None:
+            return bool(cached)
+
+        return next(self.__iter_source_line_comments(fp, bug_line),
+                    None) is not None
+
+    def __get_cached_comments(
+        self,
+        fp: TextIO,
+        bug_line: int
+    ) -> Optional[SourceCodeComments]:
+        """
+        Return the already parsed source code comments for the bug line,
+        otherwise None.
+        """
+        self.__select_file(fp)
+
+        # Multiple reports can be found at the same line so do not parse the
+        # same comments again.
+        return self.__comment_cache.get(bug_line)
+
+    def __iter_source_line_comments(
+        self,
+        fp: TextIO,
+        bug_line: int
+    ) -> Iterator[SourceCodeComment]:
+        """
+        Walk the source lines backward from the bug line and yield the
+        source code comments in the order they are found.
+
+        raise: SpellException in case there is a spell error in the
+               codechecker review comment keyword
+        """
+        previous_line_num = bug_line - 1
+        curr_suppress_comment: Deque[str] = deque()
+
+        # Only the lines above the bug line are read.
+        lines = self.__read_lines(fp, previous_line_num)
 
         # Iterate over lines while it has comments or we reached
         # the top of the file.
         cstyle_end_found = False
 
-        while True:
-            source_line = util.get_linef(fp, previous_line_num)
+        while previous_line_num >= 1:
+            source_line = lines[previous_line_num - 1] \
+                if previous_line_num <= len(lines) else ''
 
             # cpp style comment
             is_comment = \
@@ -263,54 +442,20 @@ class SourceCodeCommentHandler:
             if not cstyle_end_found and cstyle_end:
                 cstyle_end_found = True
 
-            curr_suppress_comment.append(source_line)
-            has_any_marker = any(marker in source_line for marker
-                                 in self.source_code_comment_markers)
+            curr_suppress_comment.appendleft(source_line)
+            has_any_marker = \
+                self._get_marker_pattern().search(source_line) is not None
 
             # It is a comment.
             if has_any_marker:
-                rev = list(reversed(curr_suppress_comment))
-
-                orig_review_comment = ' '.join(rev)
-
-                if rev[0].strip().startswith('//'):
-                    review_comment = orig_review_comment.replace('//', '')
-                else:
-                    r_comment = []
-                    for comment in rev:
-                        comment = comment.strip()
-                        comment = comment.replace('/*', '').replace('*/', '')
-                        if comment.startswith('*'):
-                            r_comment.append(comment[1:])
-                        else:
-                            r_comment.append(comment)
-
-                    review_comment = ' '.join(r_comment).strip()
-
-                source_line_comment = self.__process_source_line_comment(
-                    review_comment)
-
-                if source_line_comment:
-                    source_line_comment.line = orig_review_comment
-                    source_line_comments.append(source_line_comment)
-                else:
-                    orig_review_comment = orig_review_comment.strip()
-                    raise SpellException(
-                            f"misspelled review status comment "
-                            f"@{previous_line_num}: "
-                            f"{orig_review_comment.strip()}")
-
-                curr_suppress_comment = []
-
-            if previous_line_num > 0:
-                previous_line_num -= 1
-            else:
-                break
+                yield self.__parse_review_comment(
+                    curr_suppress_comment, previous_line_num)
+                curr_suppress_comment = deque()
 
             if cstyle_start:
                 break
 
-        return source_line_comments
+            previous_line_num -= 1
 
     def filter_source_line_comments(
         self,
@@ -349,11 +494,14 @@ class SourceCodeCommentHandler:
         if not source_line_comments:
             return []
 
-        checker_name_comments = []
-        for line_comment in source_line_comments:
-            for bug_name in line_comment.checkers:
-                if (bug_name in checker_name) or (bug_name == 'all'):
-                    checker_name_comments.append(line_comment)
+        checker_name_comments = [
+            line_comment for line_comment in source_line_comments
+            if 'all' in line_comment.checkers or
+            any(bug_name in checker_name
+                for bug_name in line_comment.checkers)]
+
+        if not LOG.isEnabledFor(logging.DEBUG):
+            return checker_name_comments
 
         # More than one source code comment found for this line.
         if not checker_name_comments:
@@ -361,10 +509,10 @@ class SourceCodeCommentHandler:
                       checker_name)
         elif len(checker_name_comments) > 1:
             LOG.debug("Multiple source code comment can be found for '%s' "
-                      "checker at line %s.", checker_name, bug_line)
-            LOG.debug(checker_name_comments)
+                      "checker at line %s: %s", checker_name, bug_line,
+                      checker_name_comments)
         else:
-            LOG.debug("The following source code comment is found for"
+            LOG.debug("The following source code comment is found for "
                       "checker '%s': %s", checker_name,
                       checker_name_comments[0])
         return checker_name_comments
@@ -11,11 +11,12 @@
 """Tests for source code comments in source file."""
 
 
+import io
 import os
 import unittest
 
 from codechecker_report_converter.source_code_comment_handler import \
-    SourceCodeComment, SourceCodeCommentHandler
+    SourceCodeComment, SourceCodeCommentHandler, SpellException
 
 
 class SourceCodeCommentTestCase(unittest.TestCase):
@@ -770,3 +771,238 @@ class SourceCodeCommentTestCase(unittest.TestCase):
         current_line_comments = sc_handler.filter_source_line_comments(
             self.__tmp_srcfile_3, bug_line, 'my.dummy')
         self.assertEqual(len(current_line_comments), 0)
+
+    def test_comments_are_cached(self):
+        """
+        Querying the same line again should not read the file or parse the
+        comments again.
+        """
+        class CountingStringIO(io.StringIO):
+            read_lines = 0
+
+            def __next__(self):
+                CountingStringIO.read_lines += 1
+                return super().__next__()
+
+        class CountingHandler(SourceCodeCommentHandler):
+            parsed_comments = 0
+
+            @classmethod
+            def _get_pattern(cls):
+                CountingHandler.parsed_comments += 1
+                return super()._get_pattern()
+
+        with open(os.path.join(self.__test_src_dir, 'test_file_1'),
+                  encoding='utf-8', errors='ignore') as f:
+            src_file = CountingStringIO(f.read())
+
+        sc_handler = CountingHandler()
+        source_line_comments = sc_handler.get_source_line_comments(
+            src_file, 16)
+        self.assertEqual(len(source_line_comments), 1)
+        self.assertEqual(CountingStringIO.read_lines, 15)
+        self.assertEqual(CountingHandler.parsed_comments, 1)
+
+        self.assertEqual(
+            sc_handler.get_source_line_comments(src_file, 16),
+            source_line_comments)
+        self.assertEqual(CountingStringIO.read_lines, 15)
+        self.assertEqual(CountingHandler.parsed_comments, 1)
+
+        # Lines above the already read ones are not read again.
+        self.assertEqual(
+            len(sc_handler.get_source_line_comments(src_file, 9)), 0)
+        self.assertEqual(CountingStringIO.read_lines, 15)
+
+    def test_no_stale_comments_across_files(self):
+        """
+        A handler used for another file object should not return the
+        comments of the previous one.
+        """
+        sc_handler = SourceCodeCommentHandler()
+
+        source_line_comments = sc_handler.get_source_line_comments(
+            self.__tmp_srcfile_1, 16)
+        self.assertEqual(len(source_line_comments), 1)
+        self.assertEqual(source_line_comments[0].checkers, {'all'})
+
+        source_line_comments = sc_handler.get_source_line_comments(
+            self.__tmp_srcfile_3, 16)
+        self.assertEqual(len(source_line_comments), 0)
+
+        source_line_comments = sc_handler.get_source_line_comments(
+            self.__tmp_srcfile_3, 17)
+        self.assertEqual(len(source_line_comments), 1)
+        self.assertEqual(source_line_comments[0].status, 'confirmed')
+
+    def test_multiple_matching_checker_names_in_one_comment(self):
+        """
+        A comment which matches the checker name in multiple ways should be
+        returned only once.
+        """
+        bug_line = 65
+        sc_handler = SourceCodeCommentHandler()
+
+        current_line_comments = sc_handler.filter_source_line_comments(
+            self.__tmp_srcfile_3, bug_line, 'my.checker_1')
+        self.assertEqual(len(current_line_comments), 1)
+        self.assertEqual(current_line_comments[0].checkers,
+                         {'all', 'my.checker_1'})
+        self.assertEqual(current_line_comments[0].message, 'some comment')
+
+    def test_file_position_is_restored(self):
+        """
+        Reading the source code comments should not change the position in
+        the file object.
+        """
+        sc_handler = SourceCodeCommentHandler()
+
+        self.__tmp_srcfile_1.seek(0)
+        self.__tmp_srcfile_1.readline()
+        pos = self.__tmp_srcfile_1.tell()
+
+        source_line_comments = sc_handler.get_source_line_comments(
+            self.__tmp_srcfile_1, 16)
+        self.assertEqual(len(source_line_comments), 1)
+        self.assertEqual(self.__tmp_srcfile_1.tell(), pos)
+
+        sc_handler.scan_source_line_comments(self.__tmp_srcfile_1, [16, 23])
+        self.assertEqual(self.__tmp_srcfile_1.tell(), pos)
+
+    def test_comment_after_cstyle_comment_line(self):
+        """
+        The line before the '//' comment block closes a C style comment so
+        the comments are collected by walking the lines backward also when
+        multiple lines are scanned.
+        """
+        bug_line = 72
+        expected = [
+            SourceCodeComment(
+                checkers={'my.checker_1'},
+                message='after c style comment',
+                status='confirmed',
+                line='// codechecker_confirmed [ my.checker_1 ] after c '
+                     'style comment\n'),
+            SourceCodeComment(
+                checkers={'my.checker_2'},
+                message='c style comment',
+                status='false_positive',
+                line='/* codechecker_suppress [ my.checker_2 ] c style '
+                     'comment\n */\n')]
+
+        sc_handler = SourceCodeCommentHandler()
+        source_line_comments = sc_handler.get_source_line_comments(
+            self.__tmp_srcfile_3, bug_line)
+        self.assertEqual(source_line_comments, expected)
+
+        sc_handler = SourceCodeCommentHandler()
+        comments, misspelled_comments = sc_handler.scan_source_line_comments(
+            self.__tmp_srcfile_3, [bug_line])
+        self.assertEqual(comments, [(bug_line, expected)])
+        self.assertEqual(misspelled_comments, [])
+
+    def test_scan_matches_single_line_queries(self):
+        """
+        Scanning multiple lines should give the same comments as querying
+        the lines one by one.
+        """
+        # The second test file does not contain any review comments so it
+        # is not scanned at all.
+        for src_file in [self.__tmp_srcfile_1, self.__tmp_srcfile_3]:
+            src_file.seek(0)
+            line_numbers = range(1, len(src_file.readlines()) + 2)
+
+            expected = []
+            expected_misspelled = []
+            for num in line_numbers:
+                try:
+                    expected.append((
+                        num,
+                        SourceCodeCommentHandler().get_source_line_comments(
+                            src_file, num)))
+                except SpellException as ex:
+                    expected_misspelled.append(str(ex))
+
+            comments, misspelled_comments = \
+                SourceCodeCommentHandler().scan_source_line_comments(
+                    src_file, line_numbers)
+            self.assertEqual(comments, expected)
+            self.assertEqual(misspelled_comments, expected_misspelled)
+
+    def test_has_comment_above_misspelled_comment(self):
+        """
+        A valid comment is found right above the bug line even if a comment
+        above it is misspelled, regardless of how the comments are collected.
+        """
+        for note in ['// note\n', '// note */\n']:
+            src_file = io.StringIO(
+                '// codechecker_suppress [all typo\n' +
+                note +
+                '// codechecker_suppress [all] ok\n'
+                'int x;\n')
+
+            sc_handler = SourceCodeCommentHandler()
+            self.assertTrue(sc_handler.has_source_line_comments(src_file, 4))
+
+            with self.assertRaises(SpellException):
+                sc_handler.get_source_line_comments(src_file, 4)
+
+            comments, misspelled_comments = \
+                SourceCodeCommentHandler().scan_source_line_comments(
+                    src_file, [4])
+            self.assertEqual(comments, [])
+            self.assertEqual(len(misspelled_comments), 1)
+
+    def test_has_comment_after_parsed_comments(self):
+        """
+        Already parsed comments give the same result as walking the lines.
+        """
+        src_file = io.StringIO(
+            '// codechecker_suppress [all] ok\n'
+            'int x;\n'
+            'int y;\n')
+
+        sc_handler = SourceCodeCommentHandler()
+        self.assertTrue(sc_handler.has_source_line_comments(src_file, 2))
+        self.assertFalse(sc_handler.has_source_line_comments(src_file, 3))
+
+        self.assertEqual(
+            len(sc_handler.get_source_line_comments(src_file, 2)), 1)
+        self.assertEqual(
+            len(sc_handler.get_source_line_comments(src_file, 3)), 0)
+
+        self.assertTrue(sc_handler.has_source_line_comments(src_file, 2))
+        self.assertFalse(sc_handler.has_source_line_comments(src_file, 3))
+
+    def test_comment_marker_of_subclass(self):
+        """
+        Comment markers added by a subclass are handled as review comments.
+        """
+        class Handler(SourceCodeCommentHandler):
+            source_code_comment_markers = \
+                SourceCodeCommentHandler.source_code_comment_markers + \
+                ['cc_ignore']
+
+        src_file = io.StringIO('// cc_ignore [all] ok\nint x;\n')
+
+        source_line_comments = \
+            Handler().get_source_line_comments(src_file, 2)
+        self.assertEqual(len(source_line_comments), 1)
+        self.assertEqual(source_line_comments[0].checkers, {'all'})
+        self.assertEqual(source_line_comments[0].message, 'ok')
+        self.assertEqual(source_line_comments[0].status, 'false_positive')
+
+    def test_comment_marker_with_special_characters(self):
+        """
+        Comment markers are matched literally, even if they contain regex
+        special characters.
+        """
+        class Handler(SourceCodeCommentHandler):
+            source_code_comment_markers = ['cc_ignore(x)']
+
+        src_file = io.StringIO('// cc_ignore(x) [all] ok\nint x;\n')
+
+        source_line_comments = \
+            Handler().get_source_line_comments(src_file, 2)
+        self.assertEqual(len(source_line_comments), 1)
+        self.assertEqual(source_line_comments[0].message, 'ok')